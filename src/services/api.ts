@@ -602,6 +602,99 @@ export const getStudySession = async (sessionId: string): Promise<StudySession>
   }
 };
 
+// Max retries for each generate-more-questions request on transient errors
+const MAX_GENERATION_RETRIES = 4;
+
+// Upper bound on any single retry delay, including server-supplied Retry-After
+const MAX_RETRY_DELAY_MS = 30000;
+
+// generate-more-questions is a non-idempotent POST, so only statuses that mean
+// the request was rejected before any generation started are retried. 502/504
+// are deliberately excluded: a gateway timeout usually means the backend is
+// still running the LLM batch, and re-POSTing would generate it twice.
+const TRANSIENT_STATUSES = new Set([429, 503]);
+
+// Provider wording for prompts that exceed the model's context window
+const CONTEXT_LENGTH_ERROR_PATTERNS = /prompt is too long|context_length_exceeded/i;
+
+interface RetryOptions {
+  maxRetries: number;
+  isRetryable: (response: Response) => Promise<boolean>;
+}
+
+/**
+ * Parse a Retry-After header (delta-seconds or HTTP date) into milliseconds
+ */
+const parseRetryAfter = (header: string | null): number | null => {
+  if (!header) return null;
+
+  const seconds = Number(header);
+  if (!isNaN(seconds)) return Math.max(0, seconds * 1000);
+
+  const date = Date.parse(header);
+  return isNaN(date) ? null : Math.max(0, date - Date.now());
+};
+
+/**
+ * Decide whether a failed generate-more-questions response is worth retrying.
+ * A 500 is retried unless its detail carries the provider's context-length
+ * error, which would fail the same way on every attempt.
+ */
+const isRetryableGenerationError = async (response: Response): Promise<boolean> => {
+  if (TRANSIENT_STATUSES.has(response.status)) return true;
+  if (response.status !== 500) return false;
+
+  try {
+    const errorData = await response.clone().json();
+    const detail = typeof errorData?.detail === 'string' ? errorData.detail : '';
+    return !CONTEXT_LENGTH_ERROR_PATTERNS.test(detail);
+  } catch {
+    // Body is not JSON - nothing suggests a permanent failure
+    return true;
+  }
+};
+
+/**
+ * fetch() with bounded retries and jittered exponential backoff.
+ * Network failures (fetch rejecting) are retried too; the last rejection is
+ * rethrown once retries are exhausted. Returns the last response (ok or not)
+ * once it succeeds, is not retryable, or retries are exhausted.
+ *
+ * Retry-After is used as a lower bound on the delay (capped at
+ * MAX_RETRY_DELAY_MS). The API is cross-origin, so the header is only
+ * readable when the backend sends `Access-Control-Expose-Headers: Retry-After`;
+ * otherwise the exponential backoff alone applies.
+ */
+const fetchWithRetry = async (
+  url: string,
+  init: RequestInit,
+  { maxRetries, isRetryable }: RetryOptions
+): Promise<Response> => {
+  for (let attempt = 0; ; attempt++) {
+    let response: Response | null = null;
+    try {
+      response = await fetch(url, init);
+    } catch (error) {
+      // Offline, DNS failure, refused or reset connection. A connection that
+      // drops after the backend accepted the POST can still lead to a
+      // duplicate generation; that is the accepted cost of not stalling
+      // progressive loading on a flaky network.
+      if (attempt >= maxRetries) throw error;
+    }
+
+    if (response && (response.ok || attempt >= maxRetries || !(await isRetryable(response)))) {
+      return response;
+    }
+
+    const backoff = Math.min(1000 * 2 ** attempt, MAX_RETRY_DELAY_MS) * (0.5 + Math.random() / 2);
+    const retryAfter = response ? parseRetryAfter(response.headers.get('Retry-After')) : null;
+    const delay = Math.min(Math.max(backoff, retryAfter ?? 0), MAX_RETRY_DELAY_MS);
+
+    console.warn(`Request to ${url} failed (${response ? response.status : 'network error'}), retrying in ${Math.round(delay)}ms (attempt ${attempt + 1}/${maxRetries})`);
+    await new Promise(resolve => setTimeout(resolve, delay));
+  }
+};
+
 /**
  * Generate more questions for remaining subtopics (automatic progressive loading)
  * This should be called automatically after session creation to load all remaining questions
@@ -622,12 +715,16 @@ export const generateAllRemainingQuestions = async (
     console.log(`🔄 Starting automatic question generation for session ${sessionId}`);
 
     while (hasMore) {
-      const response = await fetch(`${API_URL}/study-sessions/${sessionId}/generate-more-questions`, {
-        method: 'POST',
-        headers: {
-          'Authorization': `Bearer ${token}`,
+      const response = await fetchWithRetry(
+        `${API_URL}/study-sessions/${sessionId}/generate-more-questions`,
+        {
+          method: 'POST',
+          headers: {
+            'Authorization': `Bearer ${token}`,
+          },
         },
-      });
+        { maxRetries: MAX_GENERATION_RETRIES, isRetryable: isRetryableGenerationError }
+      );
 
       if (!response.ok) {
         console.error('Failed to generate more questions:', response.statusText);